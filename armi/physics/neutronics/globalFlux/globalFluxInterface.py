@@ -14,10 +14,10 @@
 
 """The Global flux interface provide a base class for all neutronics tools that compute the neutron and/or photon flux."""
 import math
-from typing import Dict, Optional
+import weakref
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 import numpy
-import scipy.integrate
 
 from armi import interfaces
 from armi import runLog
@@ -27,17 +27,30 @@ from armi.physics import neutronics
 from armi.reactor import geometry
 from armi.reactor import reactors
 from armi.reactor.blocks import Block
-from armi.reactor.converters import geometryConverters
-from armi.reactor.converters import uniformMesh
 from armi.reactor.flags import Flags
 from armi.settings.caseSettings import Settings
 from armi.utils import units, codeTiming, getMaxBurnSteps
 
+if TYPE_CHECKING:  # pragma: no cover
+    from armi.reactor.converters.geometryConverters import GeometryConverter
+
 ORDER = interfaces.STACK_ORDER.FLUX
 
 RX_ABS_MICRO_LABELS = ["nGamma", "fission", "nalph", "np", "nd", "nt"]
+CAPTURE_LABELS = tuple(name for name in RX_ABS_MICRO_LABELS if name != "fission")
 RX_PARAM_NAMES = ["rateCap", "rateFis", "rateProdN2n", "rateProdFis", "rateAbs"]
 
+# shared by the cleared adjoint flux, gamma flux and source of all blocks. These params
+# store it by reference; sharing is only safe because in-place operations on a size-0
+# array change nothing. mgFlux, which is rescaled in place, gets its own array.
+_EMPTY_FLUX = numpy.empty(0)
+
+# dpa cross section set name -> (source values, read-only array), see ``_getDpaXsArray``
+_DPA_XS_ARRAYS: Dict[str, Tuple[List[float], numpy.ndarray]] = {}
+
+# nuclide micro cross sections -> (source arrays, read-only matrix), see ``_getReactionXs``
+_REACTION_XS = weakref.WeakKeyDictionary()
+
 
 class GlobalFluxInterface(interfaces.Interface):
     """
@@ -61,6 +74,9 @@ class GlobalFluxInterface(interfaces.Interface):
             self.nodeFmt = "03d"  # produce ig001_001.inp
         else:
             self.nodeFmt = "1d"  # produce ig001_1.inp.
+        # build names with proper number of zeros
+        self._timeIdTemplate = f"{{0:{self.cycleFmt}}}_{{1:{self.nodeFmt}}}"
+        self._coupledTimeIdTemplate = self._timeIdTemplate + "_{2:03d}"
         self._bocKeff = None  # for tracking rxSwing
         self._setTightCouplingDefaults()
 
@@ -89,8 +105,9 @@ class GlobalFluxInterface(interfaces.Interface):
         self.r.core.p.elevationOfACLP3Cycles = 0.0
         self.r.core.p.elevationOfACLP7Cycles = 0.0
         for b in self.r.core.getBlocks():
-            b.p.detailedDpaThisCycle = 0.0
-            b.p.newDPA = 0.0
+            p = b.p
+            p.detailedDpaThisCycle = 0.0
+            p.newDPA = 0.0
 
     def interactEveryNode(self, cycle, node):
         """
@@ -113,11 +130,13 @@ class GlobalFluxInterface(interfaces.Interface):
     def interactEOC(self, cycle=None):
         interfaces.Interface.interactEOC(self, cycle)
         if self._bocKeff is not None:
-            self.r.core.p.rxSwing = (
-                (self.r.core.p.keff - self._bocKeff)
-                / self._bocKeff
-                * units.ABS_REACTIVITY_TO_PCM
-            )
+            delta = self.r.core.p.keff - self._bocKeff
+            if delta:
+                self.r.core.p.rxSwing = (
+                    delta / self._bocKeff * units.ABS_REACTIVITY_TO_PCM
+                )
+            else:
+                self.r.core.p.rxSwing = 0.0
 
     def checkEnergyBalance(self):
         """Check that there is energy balance between the power generated and the specified power.
@@ -180,23 +199,15 @@ class GlobalFluxInterface(interfaces.Interface):
         stdName : str
             Standard output file name
         """
-        timeId = (
-            "{0:" + self.cycleFmt + "}_{1:" + self.nodeFmt + "}"
-        )  # build names with proper number of zeros
         if coupledIter is not None:
-            timeId += "_{0:03d}".format(coupledIter)
+            timeId = self._coupledTimeIdTemplate.format(cycle, node, coupledIter)
+        else:
+            timeId = self._timeIdTemplate.format(cycle, node)
 
-        inName = (
-            self.cs.caseTitle
-            + timeId.format(cycle, node)
-            + "{}.{}.inp".format(additionalLabel, self.name)
-        )
-        outName = (
-            self.cs.caseTitle
-            + timeId.format(cycle, node)
-            + "{}.{}.out".format(additionalLabel, self.name)
-        )
-        stdName = outName.strip(".out") + ".stdout"
+        baseName = f"{self.cs.caseTitle}{timeId}{additionalLabel}.{self.name}"
+        inName = baseName + ".inp"
+        outName = baseName + ".out"
+        stdName = baseName + ".stdout"
 
         return inName, outName, stdName
 
@@ -272,12 +283,10 @@ class GlobalFluxInterfaceUsingExecuters(GlobalFluxInterface):
         if self.coupler.parameter == "power":
             scaledCorePowerDistribution = []
             for a in self.r.core.getChildren():
-                scaledPower = []
-                assemPower = sum(b.p.power for b in a)
-                for b in a:
-                    scaledPower.append(b.p.power / assemPower)
-
-                scaledCorePowerDistribution.append(scaledPower)
+                blockPowers = a.getChildParamValues("power")
+                # the coupler compares ragged lists, one per assembly
+                scaledPower = blockPowers / blockPowers.sum()
+                scaledCorePowerDistribution.append(scaledPower.tolist())
 
             return scaledCorePowerDistribution
 
@@ -502,7 +511,7 @@ class GlobalFluxOptions(executers.ExecutionOptions):
         self.real = neutronics.realCalculationRequested(cs)
         self.detailedAxialExpansion = cs[CONF_DETAILED_AXIAL_EXPANSION]
         self.hasNonUniformAssems = any(
-            [Flags.fromStringIgnoreErrors(f) for f in cs[CONF_NON_UNIFORM_ASSEM_FLAGS]]
+            Flags.fromStringIgnoreErrors(f) for f in cs[CONF_NON_UNIFORM_ASSEM_FLAGS]
         )
         self.eigenvalueProblem = cs[CONF_EIGEN_PROB]
 
@@ -571,7 +580,7 @@ class GlobalFluxExecuter(executers.DefaultExecuter):
     def __init__(self, options: GlobalFluxOptions, reactor):
         executers.DefaultExecuter.__init__(self, options, reactor)
         self.options: GlobalFluxOptions
-        self.geomConverters: Dict[str, geometryConverters.GeometryConverter] = {}
+        self.geomConverters: Dict[str, "GeometryConverter"] = {}
 
     @codeTiming.timed
     def _performGeometryTransformations(self, makePlots=False):
@@ -593,6 +602,8 @@ class GlobalFluxExecuter(executers.DefaultExecuter):
         --------
         _undoGeometryTransformations
         """
+        from armi.reactor.converters import geometryConverters, uniformMesh
+
         if any(self.geomConverters):
             raise RuntimeError(
                 "The reactor has been transformed, but not restored to the original.\n"
@@ -696,11 +707,13 @@ class GlobalFluxResultMapper(interfaces.OutputReader):
 
     def clearFlux(self):
         """Delete flux on all blocks. Needed to prevent stale flux when partially reloading."""
+        empty = _EMPTY_FLUX
         for b in self.r.core.getBlocks():
-            b.p.mgFlux = []
-            b.p.adjMgFlux = []
-            b.p.mgFluxGamma = []
-            b.p.extSrc = []
+            p = b.p
+            p.mgFlux = numpy.empty(0)
+            p.adjMgFlux = empty
+            p.mgFluxGamma = empty
+            p.extSrc = empty
 
     def _renormalizeNeutronFluxByBlock(self, renormalizationCorePower):
         """
@@ -716,31 +729,56 @@ class GlobalFluxResultMapper(interfaces.OutputReader):
         --------
         getTotalEnergyGenerationConstants
         """
-        # update the block power param here as well so
-        # the ratio/multiplications below are consistent
-        currentCorePower = 0.0
-        for b in self.r.core.getBlocks():
-            # The multi-group flux is volume integrated, so J/cm * n-cm/s gives units of Watts
-            b.p.power = numpy.dot(
-                b.getTotalEnergyGenerationConstants(), b.getIntegratedMgFlux()
+        blocks = self.r.core.getBlocks()
+
+        # gather the block data into (nBlocks, nGroups) arrays so the power and flux
+        # of every block can be computed at once rather than block-by-block
+        energyGenConsts = numpy.array(
+            [b.getTotalEnergyGenerationConstants() for b in blocks]
+        )
+        integratedFlux = numpy.array([b.getIntegratedMgFlux() for b in blocks])
+        volumes = numpy.array([b.getVolume() for b in blocks])
+
+        # The multi-group flux is volume integrated, so J/cm * n-cm/s gives units of Watts
+        powers = numpy.einsum("bg,bg->b", energyGenConsts, integratedFlux)
+        fluxes = integratedFlux.sum(axis=1) / volumes
+        currentCorePower = powers.sum()
+        if currentCorePower == 0.0:
+            raise ValueError(
+                "Cannot renormalize the neutron flux in {} to {} W because the "
+                "current flux generates no power.".format(
+                    self.r.core, renormalizationCorePower
+                )
             )
-            b.p.flux = sum(b.getMgFlux())
-            currentCorePower += b.p.power
 
         powerRatio = renormalizationCorePower / currentCorePower
-        runLog.info(
-            "Renormalizing the neutron flux in {:<s} by a factor of {:<8.5e}, "
-            "which is derived from the current core power of {:<8.5e} W and "
-            "desired power of {:<8.5e} W".format(
-                self.r.core, powerRatio, currentCorePower, renormalizationCorePower
+        rescale = not math.isclose(powerRatio, 1.0, rel_tol=1e-12)
+        if rescale:
+            runLog.info(
+                "Renormalizing the neutron flux in {:<s} by a factor of {:<8.5e}, "
+                "which is derived from the current core power of {:<8.5e} W and "
+                "desired power of {:<8.5e} W".format(
+                    self.r.core, powerRatio, currentCorePower, renormalizationCorePower
+                )
+            )
+            powers *= powerRatio
+            fluxes *= powerRatio
+        else:
+            runLog.info(
+                "The neutron flux in {} already produces the desired power of "
+                "{:<8.5e} W; skipping renormalization".format(
+                    self.r.core, renormalizationCorePower
+                )
             )
-        )
-        for b in self.r.core.getBlocks():
-            b.p.mgFlux *= powerRatio
-            b.p.flux *= powerRatio
-            b.p.fluxPeak *= powerRatio
-            b.p.power *= powerRatio
-            b.p.pdens = b.p.power / b.getVolume()
+
+        pdens = powers / volumes
+        for b, power, flux, pd in zip(blocks, powers, fluxes, pdens):
+            if rescale:
+                b.p.mgFlux *= powerRatio
+                b.p.fluxPeak *= powerRatio
+            b.p.flux = flux
+            b.p.power = power
+            b.p.pdens = pd
 
     def _updateDerivedParams(self):
         """Computes some params that are derived directly from flux and power parameters."""
@@ -754,10 +792,10 @@ class GlobalFluxResultMapper(interfaces.OutputReader):
 
         conversion = units.CM2_PER_M2 / units.WATTS_PER_MW
         for a in self.r.core:
-            area = a.getArea()
-            for b in a:
-                b.p.arealPd = b.p.power / area * conversion
-            a.p.arealPd = a.calcTotalParam("arealPd")
+            arealPds = a.getChildParamValues("power") * (conversion / a.getArea())
+            for b, arealPd in zip(a, arealPds):
+                b.p.arealPd = arealPd
+            a.p.arealPd = arealPds.sum()
         self.r.core.p.maxPD = self.r.core.getMaxParam("arealPd")
         self._updateAssemblyLevelParams()
 
@@ -771,24 +809,26 @@ class GlobalFluxResultMapper(interfaces.OutputReader):
 
         Returns
         -------
-            list : cross section values
+            numpy.ndarray : cross section values
         """
+        return self._makeDpaXsGetter()(b)
+
+    def _makeDpaXsGetter(self):
+        """Return a function that implements ``getDpaXs``, reading the settings only once."""
         from armi.physics.neutronics.settings import (
             CONF_DPA_XS_SET,
             CONF_GRID_PLATE_DPA_XS_SET,
         )
 
-        if self.cs[CONF_GRID_PLATE_DPA_XS_SET] and b.hasFlags(Flags.GRID_PLATE):
-            dpaXsSetName = self.cs[CONF_GRID_PLATE_DPA_XS_SET]
-        else:
-            dpaXsSetName = self.cs[CONF_DPA_XS_SET]
+        gridPlateDpaXsSetName = self.cs[CONF_GRID_PLATE_DPA_XS_SET]
+        dpaXsSetName = self.cs[CONF_DPA_XS_SET]
 
-        try:
-            return constants.DPA_CROSS_SECTIONS[dpaXsSetName]
-        except KeyError:
-            raise KeyError(
-                "DPA cross section set {} does not exist".format(dpaXsSetName)
-            )
+        def getDpaXs(b: Block):
+            if gridPlateDpaXsSetName and b.hasFlags(Flags.GRID_PLATE):
+                return _getDpaXsArray(gridPlateDpaXsSetName)
+            return _getDpaXsArray(dpaXsSetName)
+
+        return getDpaXs
 
     def getBurnupPeakingFactor(self, b: Block):
         """
@@ -811,16 +851,37 @@ class GlobalFluxResultMapper(interfaces.OutputReader):
         burnupPeakingFactor : float
             The peak/avg factor for burnup and DPA.
         """
-        burnupPeakingFactor = self.cs["burnupPeakingFactor"]
-        if not burnupPeakingFactor and b.p.fluxPeak:
-            burnupPeakingFactor = b.p.fluxPeak / b.p.flux
-        elif not burnupPeakingFactor:
-            # no peak available. Finite difference model?
-            # Use 0.0 for peaking so that there isn't misuse of peaking values that don't actually have peaking applied.
-            # Uet self.cs["burnupPeakingFactor"] or b.p.fluxPeak for different behavior
-            burnupPeakingFactor = 0.0
+        return self._makeBurnupPeakingFactorGetter()(b)
+
+    def _makeBurnupPeakingFactorGetter(self):
+        """Return a function that implements ``getBurnupPeakingFactor``, reading the setting once."""
+        userPeakingFactor = self.cs["burnupPeakingFactor"]
+
+        def getBurnupPeakingFactor(b: Block):
+            burnupPeakingFactor = userPeakingFactor
+            if not burnupPeakingFactor and b.p.fluxPeak:
+                burnupPeakingFactor = b.p.fluxPeak / b.p.flux
+            elif not burnupPeakingFactor:
+                # no peak available. Finite difference model?
+                # Use 0.0 for peaking so that there isn't misuse of peaking values that don't actually have peaking applied.
+                # Uet self.cs["burnupPeakingFactor"] or b.p.fluxPeak for different behavior
+                burnupPeakingFactor = 0.0
+
+            return burnupPeakingFactor
+
+        return getBurnupPeakingFactor
+
+    def _getBlockMethod(self, name, makeGetter):
+        """
+        Return a per-block method of this mapper for use over many blocks.
 
-        return burnupPeakingFactor
+        Unless a subclass (or instance) overrides the method, the function built by
+        ``makeGetter`` is returned instead, which reads the settings only once.
+        """
+        method = getattr(self, name)
+        if getattr(method, "__func__", None) is getattr(GlobalFluxResultMapper, name):
+            return makeGetter()
+        return method
 
     def updateDpaRate(self, blockList=None):
         """
@@ -833,18 +894,24 @@ class GlobalFluxResultMapper(interfaces.OutputReader):
         if blockList is None:
             blockList = self.r.core.getBlocks()
 
-        hasDPA = False
-        for b in blockList:
-            xs = self.getDpaXs(b)
-            hasDPA = True
-            flux = b.getMgFlux()  # n/cm^2/s
-            dpaPerSecond = computeDpaRate(flux, xs)
-            b.p.detailedDpaPeakRate = dpaPerSecond * self.getBurnupPeakingFactor(b)
-            b.p.detailedDpaRate = dpaPerSecond
-
-        if not hasDPA:
+        if not blockList:
             return
 
+        getDpaXs = self._getBlockMethod("getDpaXs", self._makeDpaXsGetter)
+        getBurnupPeakingFactor = self._getBlockMethod(
+            "getBurnupPeakingFactor", self._makeBurnupPeakingFactorGetter
+        )
+
+        # compute the rates of all blocks at once
+        dpaRates = _computeDpaRates(
+            [b.getMgFlux() for b in blockList],  # n/cm^2/s
+            [getDpaXs(b) for b in blockList],
+        )
+
+        for b, dpaPerSecond in zip(blockList, dpaRates.tolist()):
+            b.p.detailedDpaPeakRate = dpaPerSecond * getBurnupPeakingFactor(b)
+            b.p.detailedDpaRate = dpaPerSecond
+
         peakRate = self.r.core.getMaxBlockParam(
             "detailedDpaPeakRate", typeSpec=Flags.GRID_PLATE, absolute=False
         )
@@ -971,63 +1038,56 @@ class DoseResultsMapper(GlobalFluxResultMapper):
                 "Perhaps you are not running a nodal approximation."
             )
 
+        dpaPerFluence = self.options.dpaPerFluence
+        stepTimeInDays = stepTimeInSeconds / units.SECONDS_PER_DAY
+        getBurnupPeakingFactor = self._getBlockMethod(
+            "getBurnupPeakingFactor", self._makeBurnupPeakingFactorGetter
+        )
+        cornerDpaBlocks = []
+        edgeDpaBlocks = []
         for b in blockList:
-            b.p.residence += stepTimeInSeconds / units.SECONDS_PER_DAY
-            b.p.fluence += b.p.flux * stepTimeInSeconds
-            b.p.fastFluence += b.p.flux * stepTimeInSeconds * b.p.fastFluxFr
-            b.p.fastFluencePeak += b.p.fluxPeak * stepTimeInSeconds * b.p.fastFluxFr
+            p = b.p
+            p.residence += stepTimeInDays
+            p.fluence += p.flux * stepTimeInSeconds
+            p.fastFluence += p.flux * stepTimeInSeconds * p.fastFluxFr
+            p.fastFluencePeak += p.fluxPeak * stepTimeInSeconds * p.fastFluxFr
 
             # update detailed DPA based on dpa rate computed at LAST timestep.
             # new incremental DPA increase for duct distortion interface (and eq)
-            b.p.newDPA = b.p.detailedDpaRate * stepTimeInSeconds
-            b.p.newDPAPeak = b.p.detailedDpaPeakRate * stepTimeInSeconds
+            p.newDPA = p.detailedDpaRate * stepTimeInSeconds
+            p.newDPAPeak = p.detailedDpaPeakRate * stepTimeInSeconds
 
             # use = here instead of += because we need the param system to notice the change for syncronization.
-            b.p.detailedDpa = b.p.detailedDpa + b.p.newDPA
-            b.p.detailedDpaPeak = b.p.detailedDpaPeak + b.p.newDPAPeak
-            b.p.detailedDpaThisCycle = b.p.detailedDpaThisCycle + b.p.newDPA
-
-            # increment point dpas
-            # this is specific to hex geometry, but they are general neutronics block parameters
-            # if it is a non-hex block, this should be a no-op
-            if b.p.pointsCornerDpaRate is not None:
-                if b.p.pointsCornerDpa is None:
-                    b.p.pointsCornerDpa = numpy.zeros((6,))
-                b.p.pointsCornerDpa = (
-                    b.p.pointsCornerDpa + b.p.pointsCornerDpaRate * stepTimeInSeconds
-                )
-            if b.p.pointsEdgeDpaRate is not None:
-                if b.p.pointsEdgeDpa is None:
-                    b.p.pointsEdgeDpa = numpy.zeros((6,))
-                b.p.pointsEdgeDpa = (
-                    b.p.pointsEdgeDpa + b.p.pointsEdgeDpaRate * stepTimeInSeconds
-                )
+            p.detailedDpa = p.detailedDpa + p.newDPA
+            p.detailedDpaPeak = p.detailedDpaPeak + p.newDPAPeak
+            p.detailedDpaThisCycle = p.detailedDpaThisCycle + p.newDPA
+
+            # point dpas are incremented for all blocks at once below
+            if p.pointsCornerDpaRate is not None:
+                cornerDpaBlocks.append(b)
+            if p.pointsEdgeDpaRate is not None:
+                edgeDpaBlocks.append(b)
 
-            if self.options.dpaPerFluence:
+            if dpaPerFluence:
                 # do the less rigorous fluence -> DPA conversion if the user gave a factor.
-                b.p.dpaPeakFromFluence = (
-                    b.p.fastFluencePeak * self.options.dpaPerFluence
-                )
+                p.dpaPeakFromFluence = p.fastFluencePeak * dpaPerFluence
 
             # Set burnup peaking
             # b.p.percentBu/buRatePeak is expected to have been updated elsewhere (depletion)
             # (this should run AFTER burnup has been updated)
             # try to find the peak rate first
             peakRate = None
-            if b.p.buRatePeak:
+            if p.buRatePeak:
                 # best case scenario, we have peak burnup rate
-                peakRate = b.p.buRatePeak
-            elif b.p.buRate:
+                peakRate = p.buRatePeak
+            elif p.buRate:
                 # use whatever peaking factor we can find if just have rate
-                peakRate = b.p.buRate * self.getBurnupPeakingFactor(b)
+                peakRate = p.buRate * getBurnupPeakingFactor(b)
 
             # If peak rate found, use to calc peak burnup; otherwise scale burnup
             if peakRate:
                 # peakRate is in per day
-                peakRatePerSecond = peakRate / units.SECONDS_PER_DAY
-                b.p.percentBuPeak = (
-                    b.p.percentBuPeak + peakRatePerSecond * stepTimeInSeconds
-                )
+                p.percentBuPeak = p.percentBuPeak + peakRate * stepTimeInDays
             else:
                 # No rate, make bad assumption.... assumes peaking is same at each position through shuffling/irradiation history...
                 runLog.warning(
@@ -1035,15 +1095,46 @@ class DoseResultsMapper(GlobalFluxResultMapper):
                     "factor was constant through shuffling/irradiation history.",
                     single=True,
                 )
-                b.p.percentBuPeak = b.p.percentBu * self.getBurnupPeakingFactor(b)
+                p.percentBuPeak = p.percentBu * getBurnupPeakingFactor(b)
+
+        # increment point dpas
+        # this is specific to hex geometry, but they are general neutronics block parameters
+        # if there are no hex blocks, this should be a no-op
+        self._incrementPointDpas(
+            cornerDpaBlocks, "pointsCornerDpa", "pointsCornerDpaRate", stepTimeInSeconds
+        )
+        self._incrementPointDpas(
+            edgeDpaBlocks, "pointsEdgeDpa", "pointsEdgeDpaRate", stepTimeInSeconds
+        )
 
         for a in self.r.core.getAssemblies():
-            a.p.daysSinceLastMove += stepTimeInSeconds / units.SECONDS_PER_DAY
+            a.p.daysSinceLastMove += stepTimeInDays
 
         self.updateMaxDpaParams()
         self.updateCycleDoseParams()
         self.updateLoadpadDose()
 
+    @staticmethod
+    def _incrementPointDpas(blocks, dpaParam, rateParam, stepTimeInSeconds):
+        """
+        Increment a point dpa parameter of many blocks at once based on its rate.
+
+        The rates and current values are stacked into ``(nBlocks, nPoints)`` arrays so
+        the update is a single array operation. Blocks without a current value start
+        from zero dpa.
+        """
+        if not blocks:
+            return
+
+        rates = numpy.array([b.p[rateParam] for b in blocks])
+        zeros = numpy.zeros(rates.shape[1:])
+        dpas = numpy.array(
+            [zeros if b.p[dpaParam] is None else b.p[dpaParam] for b in blocks]
+        )
+        dpas = dpas + rates * stepTimeInSeconds
+        for b, dpa in zip(blocks, dpas):
+            b.p[dpaParam] = dpa
+
     def updateCycleDoseParams(self):
         r"""Updates reactor params based on the amount of dose (detailedDpa) accrued this cycle.
 
@@ -1067,10 +1158,17 @@ class DoseResultsMapper(GlobalFluxResultMapper):
 
         maxDetailedDpaThisCycle = 0.0
         peakDoseAssem = None
-        for a in self.r.core:
-            if a.getMaxParam("detailedDpaThisCycle") > maxDetailedDpaThisCycle:
-                maxDetailedDpaThisCycle = a.getMaxParam("detailedDpaThisCycle")
-                peakDoseAssem = a
+        assems = list(self.r.core)
+        if assems:
+            assemMaxDpas = numpy.fromiter(
+                (a.getMaxParam("detailedDpaThisCycle") for a in assems),
+                dtype=numpy.float64,
+                count=len(assems),
+            )
+            iPeak = int(assemMaxDpas.argmax())
+            if assemMaxDpas[iPeak] > maxDetailedDpaThisCycle:
+                maxDetailedDpaThisCycle = float(assemMaxDpas[iPeak])
+                peakDoseAssem = assems[iPeak]
         self.r.core.p.maxDetailedDpaThisCycle = maxDetailedDpaThisCycle
 
         if peakDoseAssem is None:
@@ -1166,7 +1264,7 @@ class DoseResultsMapper(GlobalFluxResultMapper):
                 The axial length of the load pad to average over
 
         This builds axial splines over the assemblies and then integrates them
-        over the load pad.
+        over the load pad with the trapezoidal rule on 100 axial points.
 
         The assumptions are that detailedDpa is the average, defined in the center
         and detailedDpaPeak is the peak, also defined in the center of blocks.
@@ -1201,37 +1299,77 @@ class DoseResultsMapper(GlobalFluxResultMapper):
 
         zrange = numpy.linspace(loadPadBottom, loadPadTop, 100)
         for a in self.r.core.getAssemblies(Flags.FUEL):
-            # scan over the load pad to find the peak dpa
-            # no caching.
-            peakDose = max(
-                a.getParamValuesAtZ("detailedDpaPeak", zrange, fillValue="extrapolate")
-            )
-            # restrict to fuel because control assemblies go nuts in dpa.
-            integrand = a.getParamOfZFunction("detailedDpa", fillValue="extrapolate")
-            returns = scipy.integrate.quad(integrand, loadPadBottom, loadPadTop)
-            avgDose = (
-                float(returns[0]) / loadPadLength
-            )  # convert to float in case it's an ndarray
-
-            # track max doses
-            if peakDose > peakPeak[0]:
-                peakPeak = (peakDose, a)
-            if avgDose > peakAvg[0]:
-                peakAvg = (avgDose, a)
+            # between the first and last axial mesh points the linearly interpolated
+            # doses cannot exceed the block values, so assemblies whose block maxima
+            # do not beat the current peaks can be skipped.
+            checkPeak = checkAvg = True
+            meshTops = a.getAxialMesh()
+            lastCenter = meshTops[-1] - a[-1].getHeight() / 2.0
+            if meshTops[0] <= loadPadBottom and loadPadTop <= lastCenter:
+                checkPeak = (
+                    a.getMaxParam("detailedDpaPeak", absolute=False) > peakPeak[0]
+                )
+                checkAvg = a.getMaxParam("detailedDpa", absolute=False) > peakAvg[0]
+
+            if checkPeak:
+                # scan over the load pad to find the peak dpa
+                # no caching.
+                peakDose = max(
+                    a.getParamValuesAtZ(
+                        "detailedDpaPeak", zrange, fillValue="extrapolate"
+                    )
+                )
+                if peakDose > peakPeak[0]:
+                    peakPeak = (peakDose, a)
+
+            if checkAvg:
+                # restrict to fuel because control assemblies go nuts in dpa.
+                # integrate the average dpa over the same axial samples
+                avgDoses = a.getParamValuesAtZ(
+                    "detailedDpa", zrange, fillValue="extrapolate"
+                )
+                avgDose = float(numpy.trapz(avgDoses, zrange)) / loadPadLength
+                if avgDose > peakAvg[0]:
+                    peakAvg = (avgDose, a)
 
         return peakPeak, peakAvg
 
 
+def _getDpaXsArray(dpaXsSetName):
+    """
+    Return a DPA cross section set as a read-only array, converting it only once.
+
+    The array is rebuilt if the set in ``constants.DPA_CROSS_SECTIONS`` is replaced.
+
+    Raises
+    ------
+    KeyError
+        The DPA cross section set does not exist.
+    """
+    try:
+        dpaXs = constants.DPA_CROSS_SECTIONS[dpaXsSetName]
+    except KeyError:
+        raise KeyError("DPA cross section set {} does not exist".format(dpaXsSetName))
+
+    cached = _DPA_XS_ARRAYS.get(dpaXsSetName)
+    if cached is None or cached[0] is not dpaXs:
+        xsArray = numpy.array(dpaXs, dtype=numpy.float64)
+        xsArray.flags.writeable = False
+        cached = (dpaXs, xsArray)
+        _DPA_XS_ARRAYS[dpaXsSetName] = cached
+    return cached[1]
+
+
 def computeDpaRate(mgFlux, dpaXs):
     r"""
     Compute the DPA rate incurred by exposure of a certain flux spectrum.
 
     Parameters
     ----------
-    mgFlux : list
+    mgFlux : list or numpy.ndarray
         multigroup neutron flux in #/cm^2/s
 
-    dpaXs : list
+    dpaXs : list or numpy.ndarray
         DPA cross section in barns to convolute with flux to determine DPA rate
 
     Returns
@@ -1275,36 +1413,103 @@ def computeDpaRate(mgFlux, dpaXs):
        Negative dpa rate.
 
     """
-    displacements = 0.0
+    mgFlux = numpy.asarray(mgFlux, dtype=numpy.float64)
+    dpaXs = numpy.asarray(dpaXs, dtype=numpy.float64)
     if len(mgFlux) != len(dpaXs):
         runLog.warning(
             "Multigroup flux of length {} is incompatible with dpa cross section of length {};"
             "dpa rate will be set do 0.0".format(len(mgFlux), len(dpaXs)),
             single=True,
         )
-        return displacements
-    for flux, barns in zip(mgFlux, dpaXs):
-        displacements += flux * barns
+        return 0.0
+    displacements = float(numpy.dot(mgFlux, dpaXs))
     dpaPerSecond = displacements * units.CM2_PER_BARN
 
-    if dpaPerSecond < 0:
+    return float(_clipNegativeDpaRates(dpaPerSecond))
+
+
+def _computeDpaRates(mgFluxes, dpaXs):
+    """
+    Compute the DPA rates of many flux spectra with a single array operation.
+
+    ``dpaXs`` holds the cross sections to use for each spectrum. The spectra are validated
+    against them once, by the shape of their stacks. Only if that fails are they computed
+    one by one with :py:func:`computeDpaRate`, so incompatible spectra get a rate of 0.0.
+
+    Returns
+    -------
+    dpaPerSecond : numpy.ndarray
+        The dpa/s due to each flux spectrum
+    """
+    try:
+        fluxes = numpy.array(mgFluxes, dtype=numpy.float64)
+        xs = numpy.array(dpaXs, dtype=numpy.float64)
+    except ValueError:
+        # spectra of different lengths, e.g. a block whose flux was cleared
+        fluxes = xs = None
+    if fluxes is not None and fluxes.ndim == 2 and fluxes.shape == xs.shape:
+        dpaRates = numpy.einsum("bg,bg->b", fluxes, xs) * units.CM2_PER_BARN
+        return _clipNegativeDpaRates(dpaRates)
+
+    return numpy.array(
+        [computeDpaRate(mgFlux, xs) for mgFlux, xs in zip(mgFluxes, dpaXs)],
+        dtype=numpy.float64,
+    )
+
+
+def _clipNegativeDpaRates(dpaPerSecond):
+    """
+    Set slightly negative DPA rates to zero.
+
+    Works on a single rate or an array of rates.
+
+    Raises
+    ------
+    RuntimeError
+       A substantially negative dpa rate.
+    """
+    minRate = numpy.min(dpaPerSecond)
+    if minRate < 0:
         runLog.warning(
-            "Negative DPA rate calculated at {}".format(dpaPerSecond),
+            "Negative DPA rate calculated at {}".format(minRate),
             single=True,
             label="negativeDpaPerSecond",
         )
         # ensure physical meaning of dpaPerSecond, it is likely just slighly negative
-        if dpaPerSecond < -1.0e-10:
+        if minRate < -1.0e-10:
             raise RuntimeError(
-                "Calculated DPA rate is substantially negative at {}".format(
-                    dpaPerSecond
-                )
+                "Calculated DPA rate is substantially negative at {}".format(minRate)
             )
-        dpaPerSecond = 0.0
+        dpaPerSecond = numpy.maximum(dpaPerSecond, 0.0)
 
     return dpaPerSecond
 
 
+def _getReactionXs(micros):
+    """
+    Return the reaction cross sections of a nuclide stacked into a read-only matrix.
+
+    The rows are the ``CAPTURE_LABELS`` cross sections followed by fission, nu-fission
+    and n2n. The matrix is built once per cross section collection and is rebuilt if any of
+    those cross sections are replaced.
+    """
+    sources = tuple(micros[name] for name in CAPTURE_LABELS) + (
+        micros.fission,
+        micros.neutronsPerFission,
+        micros.n2n,
+    )
+    cached = _REACTION_XS.get(micros)
+    if cached is None or any(old is not new for old, new in zip(cached[0], sources)):
+        xsMatrix = numpy.array(
+            sources[:-2] + (micros.fission * micros.neutronsPerFission, micros.n2n),
+            dtype=numpy.float64,
+        )
+        xsMatrix.flags.writeable = False
+        cached = (sources, xsMatrix)
+        _REACTION_XS[micros] = cached
+    return cached[1]
+
+
 def calcReactionRates(obj, keff, lib):
     r"""
     Compute 1-group reaction rates for this object (usually a block).
@@ -1358,51 +1563,43 @@ def calcReactionRates(obj, keff, lib):
             \sigma_g = \frac{\int_{E g}^{E_{g+1}} \phi(E)  \sigma(E)
             dE}{\int_{E_g}^{E_{g+1}} \phi(E) dE}
     """
-    rate = {}
-    for simple in RX_PARAM_NAMES:
-        rate[simple] = 0.0
-
     numberDensities = obj.getNumberDensities()
-
-    for nucName, numberDensity in numberDensities.items():
-        if numberDensity == 0.0:
-            continue
-        nucrate = {}
-        for simple in RX_PARAM_NAMES:
-            nucrate[simple] = 0.0
-
-        nucMc = lib.getNuclide(nucName, obj.getMicroSuffix())
-        micros = nucMc.micros
-
-        # absorption is fission + capture (no n2n here)
-        mgFlux = obj.getMgFlux()
-        for name in RX_ABS_MICRO_LABELS:
-            for g, (groupFlux, xs) in enumerate(zip(mgFlux, micros[name])):
-                # dE = flux_e*dE
-                dphi = numberDensity * groupFlux
-                nucrate["rateAbs"] += dphi * xs
-
-                if name != "fission":
-                    nucrate["rateCap"] += dphi * xs
-                else:
-                    nucrate["rateFis"] += dphi * xs
-                    # scale nu by keff.
-                    nucrate["rateProdFis"] += (
-                        dphi * xs * micros.neutronsPerFission[g] / keff
-                    )
-
-        for groupFlux, n2nXs in zip(mgFlux, micros.n2n):
-            # this n2n xs is reaction based. Multiply by 2.
-            dphi = numberDensity * groupFlux
-            nucrate["rateProdN2n"] += 2.0 * dphi * n2nXs
-
-        for simple in RX_PARAM_NAMES:
-            if nucrate[simple]:
-                rate[simple] += nucrate[simple]
-
-    for paramName, val in rate.items():
-        obj.p[paramName] = val  # put in #/cm^3/s
-
-    vFuel = obj.getComponentAreaFrac(Flags.FUEL) if rate["rateFis"] > 0.0 else 1.0
-    obj.p.fisDens = rate["rateFis"] / vFuel
-    obj.p.fisDensHom = rate["rateFis"]
+    mgFlux = numpy.asarray(obj.getMgFlux(), dtype=numpy.float64)
+    microSuffix = obj.getMicroSuffix()
+
+    # each nuclide present contributes its number density times the product of its
+    # stacked (reaction, group) cross sections with the flux
+    nucNames = [nucName for nucName, nDens in numberDensities.items() if nDens != 0.0]
+    if mgFlux.size != lib.numGroups:
+        # e.g. a block whose flux was cleared; it has no reactions
+        if mgFlux.size:
+            runLog.warning(
+                "Multigroup flux of length {} is incompatible with the {}-group cross "
+                "section library; reaction rates will be set to 0.0".format(
+                    mgFlux.size, lib.numGroups
+                ),
+                single=True,
+            )
+        nucNames = []
+    rxRates = numpy.zeros(len(CAPTURE_LABELS) + 3)
+    for nucName in nucNames:
+        xsMatrix = _getReactionXs(lib.getNuclide(nucName, microSuffix).micros)
+        rxRates += numberDensities[nucName] * numpy.dot(xsMatrix, mgFlux)
+
+    # put in #/cm^3/s
+    nCapture = len(CAPTURE_LABELS)
+    rateCap = rxRates[:nCapture].sum()
+    rateFis = rxRates[nCapture]
+    obj.p.rateCap = rateCap
+    obj.p.rateFis = rateFis
+    # absorption is fission + capture (no n2n here)
+    obj.p.rateAbs = rateCap + rateFis
+    # scale nu by keff. Without any nu-fission there is nothing to scale.
+    nuFisRate = rxRates[nCapture + 1]
+    obj.p.rateProdFis = nuFisRate / keff if nuFisRate else 0.0
+    # this n2n xs is reaction based. Multiply by 2.
+    obj.p.rateProdN2n = 2.0 * rxRates[nCapture + 2]
+
+    vFuel = obj.getComponentAreaFrac(Flags.FUEL) if rateFis > 0.0 else 1.0
+    obj.p.fisDens = rateFis / vFuel
+    obj.p.fisDensHom = rateFis
@@ -25,6 +25,7 @@ from armi.physics.neutronics.settings import (
     CONF_XS_KERNEL,
 )
 from armi.reactor import geometry
+from armi.reactor.assemblies import Assembly
 from armi.reactor.blocks import HexBlock
 from armi.reactor.flags import Flags
 from armi.reactor.tests import test_blocks
@@ -161,6 +162,29 @@ class TestGlobalFluxInterface(unittest.TestCase):
         res = globalFluxInterface.computeDpaRate(flx, xs)
         self.assertEqual(res, 10**-24 * (0.5 + 1.5 + 6))
 
+    def test_computeDpaRates(self):
+        xs = [1, 2, 3]
+        fluxes = [[0.5, 0.75, 2], [1.0, 1.0], [-1e-15, 0.0, 0.0]]
+        res = globalFluxInterface._computeDpaRates(fluxes, [xs] * 3)
+        self.assertEqual(
+            res.tolist(), [globalFluxInterface.computeDpaRate(fluxes[0], xs), 0.0, 0.0]
+        )
+
+        # spectra that all match their cross sections are computed in one shot
+        res = globalFluxInterface._computeDpaRates(
+            [fluxes[0], fluxes[2], fluxes[0]], [xs, xs, [2, 4, 6]]
+        )
+        self.assertAlmostEqual(res[0], 10**-24 * (0.5 + 1.5 + 6))
+        self.assertEqual(res[1], 0.0)
+        self.assertAlmostEqual(res[2], 2 * res[0])
+
+        # an empty flux does not stack with the others
+        res = globalFluxInterface._computeDpaRates([fluxes[0], []], [xs, xs])
+        self.assertEqual(res[1], 0.0)
+
+        with self.assertRaises(RuntimeError):
+            globalFluxInterface._computeDpaRates([[-1e15, 0.0, 0.0]], [xs])
+
     def test_interaction(self):
         """
         Ensure the basic interaction hooks work.
@@ -181,6 +205,14 @@ class TestGlobalFluxInterface(unittest.TestCase):
         inf, _outf, _stdname = gfi.getIOFileNames(1, 2, 1)
         self.assertEqual(inf, "armi001_2_001.GlobalFlux.inp")
 
+        # case titles ending in characters of ".out" are not truncated
+        cs = cs.modified(caseTitle="test")
+        gfi = MockGlobalFluxInterface(MockReactor(), cs)
+        inf, outf, stdname = gfi.getIOFileNames(1, 2, additionalLabel="-t")
+        self.assertEqual(inf, "test001_2-t.GlobalFlux.inp")
+        self.assertEqual(outf, "test001_2-t.GlobalFlux.out")
+        self.assertEqual(stdname, "test001_2-t.GlobalFlux.stdout")
+
     def test_getHistoryParams(self):
         params = globalFluxInterface.GlobalFluxInterface.getHistoryParams()
         self.assertEqual(len(params), 3)
@@ -371,6 +403,94 @@ class TestGlobalFluxResultMapper(unittest.TestCase):
 
         mapper.clearFlux()
         self.assertEqual(len(block.p.mgFlux), 0)
+        self.assertIsNot(block.p.mgFlux, r.core.getBlocks()[-1].p.mgFlux)
+
+    def test_renormalizeNeutronFluxByBlock(self):
+        o, r = test_reactors.loadTestReactor(customSettings={CONF_XS_KERNEL: "MC2v2"})
+        applyDummyFlux(r)
+        r.core.lib = isotxs.readBinary(ISOAA_PATH)
+        mapper = globalFluxInterface.GlobalFluxResultMapper(cs=o.cs)
+        mapper.r = r
+        mapper._renormalizeNeutronFluxByBlock(100)
+        b = r.core.getFirstBlock()
+        mgFlux = b.p.mgFlux.copy()
+
+        # already at the desired power, so the flux is left alone
+        mapper._renormalizeNeutronFluxByBlock(100)
+        numpy.testing.assert_array_equal(b.p.mgFlux, mgFlux)
+        self.assertAlmostEqual(r.core.calcTotalParam("power", generationNum=2), 100)
+        self.assertAlmostEqual(b.p.pdens, b.p.power / b.getVolume())
+
+        # no flux means there is nothing to renormalize
+        for b in r.core.getBlocks():
+            b.p.mgFlux = numpy.zeros(33)
+        with self.assertRaises(ValueError):
+            mapper._renormalizeNeutronFluxByBlock(100)
+
+    def test_reappliedMapperSeesNewBlocks(self):
+        """A mapper applied again after a discharge only updates blocks still in core."""
+        o, r = test_reactors.loadTestReactor()
+        applyDummyFlux(r)
+        opts = globalFluxInterface.GlobalFluxOptions("test")
+        opts.fromUserSettings(o.cs)
+        dosemapper = globalFluxInterface.DoseResultsMapper(1000, opts)
+        dosemapper.apply(r)
+
+        discharged = r.core.getAssemblies()[-1]
+        residence = discharged[0].p.residence
+        self.assertGreater(residence, 0.0)
+        r.core.removeAssembly(discharged)
+        dosemapper.apply(r)
+        self.assertEqual(discharged[0].p.residence, residence)
+
+    def test_calcLoadPadDosePruning(self):
+        """Skipping assemblies that cannot peak must not change the load pad doses."""
+        o, r = test_reactors.loadTestReactor()
+        opts = globalFluxInterface.GlobalFluxOptions("test")
+        opts.fromUserSettings(o.cs)
+        dosemapper = globalFluxInterface.DoseResultsMapper(1000, opts)
+        dosemapper.r = r
+        rng = numpy.random.default_rng(2)
+        getParamValuesAtZ = Assembly.getParamValuesAtZ
+        firstMeshPoint = r.core.getAssemblies(Flags.FUEL)[0].getAxialMesh()[0]
+
+        # the last pad starts below the axial mesh, so it needs extrapolation
+        for loadPadElevation, loadPadLength in [
+            (30.0, 30.0),
+            (50.0, 80.0),
+            (5.0, 15.0),
+        ]:
+            opts.loadPadElevation = loadPadElevation
+            opts.loadPadLength = loadPadLength
+            for b in r.core.getBlocks():
+                b.p.detailedDpa = rng.uniform(0.0, 50.0)
+                b.p.detailedDpaPeak = rng.uniform(0.0, 80.0)
+
+            with patch.object(
+                Assembly,
+                "getParamValuesAtZ",
+                autospec=True,
+                side_effect=getParamValuesAtZ,
+            ) as pruned:
+                peakPeak, peakAvg = dosemapper._calcLoadPadDose()
+
+            # without the bound every fuel assembly is evaluated
+            with patch.object(
+                Assembly, "getMaxParam", return_value=float("inf")
+            ), patch.object(
+                Assembly,
+                "getParamValuesAtZ",
+                autospec=True,
+                side_effect=getParamValuesAtZ,
+            ) as unpruned:
+                self.assertEqual(dosemapper._calcLoadPadDose(), (peakPeak, peakAvg))
+
+            self.assertGreater(peakPeak[0], 0.0)
+            self.assertGreater(peakAvg[0], 0.0)
+            if loadPadElevation < firstMeshPoint:
+                self.assertEqual(pruned.call_count, unpruned.call_count)
+            else:
+                self.assertLess(pruned.call_count, unpruned.call_count)
 
     def test_getDpaXs(self):
         cs = settings.Settings()
@@ -398,6 +518,61 @@ class TestGlobalFluxResultMapper(unittest.TestCase):
         with self.assertRaises(KeyError):
             mapper.getDpaXs(b)
 
+    def test_updateDpaRateUsesOverrides(self):
+        """Subclasses can change the dpa cross sections and peaking of a block."""
+
+        class DoubledMapper(globalFluxInterface.GlobalFluxResultMapper):
+            def getDpaXs(self, b):
+                return 2.0 * super().getDpaXs(b)
+
+            def getBurnupPeakingFactor(self, b):
+                return 3.0
+
+        o, r = test_reactors.loadTestReactor()
+        applyDummyFlux(r)
+        mapper = globalFluxInterface.GlobalFluxResultMapper(cs=o.cs)
+        mapper.r = r
+        mapper.updateDpaRate()
+        b = r.core.getFirstBlock()
+        dpaRate = b.p.detailedDpaRate
+
+        mapper = DoubledMapper(cs=o.cs)
+        mapper.r = r
+        mapper.updateDpaRate()
+        self.assertAlmostEqual(b.p.detailedDpaRate, 2.0 * dpaRate)
+        self.assertAlmostEqual(b.p.detailedDpaPeakRate, 6.0 * dpaRate)
+
+    def test_updateDpaRateNoBlocks(self):
+        """Without any blocks, the core level dpa params are left alone."""
+        o, r = test_reactors.loadTestReactor()
+        mapper = globalFluxInterface.GlobalFluxResultMapper(cs=o.cs)
+        mapper.r = r
+        r.core.p.peakGridDpaAt60Years = 1.0
+        r.core.p.maxDPA = 2.0
+        mapper.updateDpaRate(blockList=[])
+        self.assertEqual(r.core.p.peakGridDpaAt60Years, 1.0)
+        self.assertEqual(r.core.p.maxDPA, 2.0)
+
+    def test_getBlockMethod(self):
+        """Settings are read once per pass unless the per-block method is overridden."""
+        cs = settings.Settings()
+        mapper = globalFluxInterface.GlobalFluxResultMapper(cs=cs)
+        b = HexBlock("fuel", height=10.0)
+        b.p.flux = 100.0
+        b.p.fluxPeak = 250.0
+        getFactor = mapper._getBlockMethod(
+            "getBurnupPeakingFactor", mapper._makeBurnupPeakingFactorGetter
+        )
+        # the hoisted function, not the method itself
+        self.assertFalse(hasattr(getFactor, "__self__"))
+        self.assertEqual(getFactor(b), mapper.getBurnupPeakingFactor(b))
+
+        with patch.object(mapper, "getBurnupPeakingFactor", return_value=3.0):
+            getFactor = mapper._getBlockMethod(
+                "getBurnupPeakingFactor", mapper._makeBurnupPeakingFactorGetter
+            )
+            self.assertEqual(getFactor(b), 3.0)
+
     def test_getBurnupPeakingFactor(self):
         cs = settings.Settings()
         mapper = globalFluxInterface.GlobalFluxResultMapper(cs=cs)
@@ -440,6 +615,74 @@ class TestGlobalFluxUtils(unittest.TestCase):
         self.assertEqual(b.p.fisDens, b.p.rateFis / vfrac)
         self.assertEqual(b.p.fisDensHom, b.p.rateFis)
 
+    def test_calcReactionRatesValues(self):
+        """Compare the reaction rates to a sum over every nuclide, reaction and group."""
+        b = test_blocks.loadTestBlock()
+        test_blocks.applyDummyData(b)
+        lib = b.r.core.lib
+        keff = 1.01
+        globalFluxInterface.calcReactionRates(b, keff, lib)
+
+        rate = dict.fromkeys(globalFluxInterface.RX_PARAM_NAMES, 0.0)
+        mgFlux = b.getMgFlux()
+        for nucName, numberDensity in b.getNumberDensities().items():
+            if numberDensity == 0.0:
+                continue
+            micros = lib.getNuclide(nucName, b.getMicroSuffix()).micros
+            for name in globalFluxInterface.RX_ABS_MICRO_LABELS:
+                for g, (groupFlux, xs) in enumerate(zip(mgFlux, micros[name])):
+                    dphi = numberDensity * groupFlux
+                    rate["rateAbs"] += dphi * xs
+                    if name != "fission":
+                        rate["rateCap"] += dphi * xs
+                    else:
+                        rate["rateFis"] += dphi * xs
+                        rate["rateProdFis"] += (
+                            dphi * xs * micros.neutronsPerFission[g] / keff
+                        )
+            for groupFlux, n2nXs in zip(mgFlux, micros.n2n):
+                rate["rateProdN2n"] += 2.0 * numberDensity * groupFlux * n2nXs
+
+        for paramName in ["rateCap", "rateFis", "rateAbs", "rateProdFis"]:
+            self.assertGreater(rate[paramName], 0.0)
+        for paramName, val in rate.items():
+            numpy.testing.assert_allclose(b.p[paramName], val, rtol=1e-12)
+
+    def test_calcReactionRatesEmptyFlux(self):
+        """Blocks without a flux, e.g. after clearing it, have zero reaction rates."""
+        b = test_blocks.loadTestBlock()
+        test_blocks.applyDummyData(b)
+        b.p.mgFlux = numpy.empty(0)
+        globalFluxInterface.calcReactionRates(b, 1.01, b.r.core.lib)
+        for paramName in globalFluxInterface.RX_PARAM_NAMES:
+            self.assertEqual(b.p[paramName], 0.0)
+        self.assertEqual(b.p.fisDens, 0.0)
+        self.assertEqual(b.p.fisDensHom, 0.0)
+
+    def test_getReactionXs(self):
+        b = test_blocks.loadTestBlock()
+        test_blocks.applyDummyData(b)
+        micros = b.r.core.lib.getNuclide("U235", b.getMicroSuffix()).micros
+        xsMatrix = globalFluxInterface._getReactionXs(micros)
+        self.assertIs(globalFluxInterface._getReactionXs(micros), xsMatrix)
+        self.assertFalse(xsMatrix.flags.writeable)
+        numpy.testing.assert_array_equal(
+            xsMatrix[len(globalFluxInterface.CAPTURE_LABELS)], micros.fission
+        )
+        numpy.testing.assert_array_equal(
+            xsMatrix[-2], micros.fission * micros.neutronsPerFission
+        )
+
+        # replacing a cross section rebuilds the matrix
+        originalN2n = micros.n2n
+        try:
+            micros.n2n = originalN2n * 2.0
+            numpy.testing.assert_array_equal(
+                globalFluxInterface._getReactionXs(micros)[-1], originalN2n * 2.0
+            )
+        finally:
+            micros.n2n = originalN2n
+
 
 def applyDummyFlux(r, ng=33):
     """Set arbitrary flux distribution on reactor."""